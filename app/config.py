@@ -3,11 +3,19 @@ Configuration management for Dot Service.
 Loads settings from environment variables / .env file.
 """
 
+import os
+from dataclasses import dataclass, fields
 from functools import lru_cache
-from pydantic_settings import BaseSettings
+from typing import Callable
 
+from dotenv import load_dotenv
 
-class Settings(BaseSettings):
+# Populate os.environ from .env once; real environment variables win.
+load_dotenv(".env", encoding="utf-8")
+
+
+@dataclass(slots=True, frozen=True)
+class Settings:
     """Application settings loaded from environment variables."""
 
     # Dot Cloud API
@@ -25,12 +33,32 @@ class Settings(BaseSettings):
     screen_width: int = 296
     screen_height: int = 152
 
-    model_config = {
-        "env_file": ".env",
-        "env_file_encoding": "utf-8",
-    }
+    @classmethod
+    def load(cls) -> "Settings":
+        """Build settings from env vars (names are case-insensitive)."""
+        env = {k.upper(): v for k, v in os.environ.items()}
+        values = {}
+        for f in fields(cls):
+            cast = _ENV_CASTS.get(f.type)
+            if cast is None:
+                raise TypeError(f"Unsupported settings type for {f.name}: {f.type!r}")
+            key = f.name.upper()
+            if key not in env:
+                continue
+            try:
+                values[f.name] = cast(env[key])
+            except ValueError as e:
+                raise ValueError(f"Invalid value for {key}: {env[key]!r}") from e
+        return cls(**values)
+
+
+# How each supported field type is parsed from its environment string
+_ENV_CASTS: dict[type, Callable[[str], object]] = {
+    str: str,
+    int: int,
+}
 
 
 @lru_cache
 def get_settings() -> Settings:
-    return Settings()
+    return Settings.load()
@@ -7,6 +7,8 @@ import logging
 from typing import Any, Optional
 
 import httpx
+import orjson
+from async_lru import alru_cache
 
 from .config import Settings, get_settings
 
@@ -14,6 +16,25 @@ logger = logging.getLogger(__name__)
 
 # Dot Cloud API base path (new V2 endpoints)
 _BASE = "/api/authV2/open"
+_DEVICES_PATH = f"{_BASE}/devices"
+_DEVICE_PREFIX = f"{_BASE}/device/"
+
+# All traffic goes to a single host, so keep a warm pool of connections
+_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=60.0,
+)
+
+
+# Dashboard polling of /devices and device status is collapsed into one
+# upstream call per this many seconds
+_POLL_CACHE_TTL = 3.0
+
+
+def _device_path(device_id: str, endpoint: str) -> str:
+    """Path of a per-device endpoint, e.g. ``status`` or ``loop/list``."""
+    return f"{_DEVICE_PREFIX}{device_id}/{endpoint}"
 
 
 class DotClientError(Exception):
@@ -45,6 +66,10 @@ class DotClient:
         self._api_key = api_key or s.dot_api_key
         self._base_url = (base_url or s.dot_api_base_url).rstrip("/")
         self._client: Optional[httpx.AsyncClient] = None
+        # Per-client TTL cache for the polled GET endpoints, keyed by path
+        self._polled_get_raw = alru_cache(maxsize=32, ttl=_POLL_CACHE_TTL)(
+            self._get_raw
+        )
 
     # ── lifecycle ────────────────────────────────────────────────
 
@@ -57,6 +82,12 @@ class DotClient:
                     "Content-Type": "application/json",
                 },
                 timeout=30.0,
+                # limits / http2 must be set on the transport when one is given
+                transport=httpx.AsyncHTTPTransport(
+                    limits=_POOL_LIMITS,
+                    http2=True,
+                    retries=1,
+                ),
             )
         return self._client
 
@@ -73,47 +104,79 @@ class DotClient:
 
     # ── helpers ──────────────────────────────────────────────────
 
-    async def _request(
-        self,
-        method: str,
-        path: str,
-        json: Optional[dict] = None,
-    ) -> Any:
+    async def _get_raw(self, path: str) -> bytes:
         client = await self._ensure_client()
-        resp = await client.request(method, path, json=json)
+        resp = await client.get(path)
+        body = self._check("GET", path, resp).strip()
+        # The raw body is passed through unparsed, so make sure it is at
+        # least a JSON null, array or object before handing it on
+        if not (
+            body == b"null"
+            or (body[:1] == b"[" and body[-1:] == b"]")
+            or (body[:1] == b"{" and body[-1:] == b"}")
+        ):
+            raise DotClientError(502, "Dot API returned a non-JSON body", body[:200])
+        return body
+
+    async def _post(self, path: str, json: Optional[dict] = None) -> Any:
+        client = await self._ensure_client()
+        resp = await client.post(path, json=json)
+        return orjson.loads(self._check("POST", path, resp))
+
+    def _invalidate_status(self, device_id: str) -> None:
+        """Drop the cached status so the next poll sees the new content."""
+        self._polled_get_raw.cache_invalidate(_device_path(device_id, "status"))
+
+    @staticmethod
+    def _check(method: str, path: str, resp: httpx.Response) -> bytes:
+        """Raise DotClientError on failure, else return the raw JSON body."""
         logger.debug("Dot API %s %s -> %s", method, path, resp.status_code)
 
         if resp.status_code >= 400:
             try:
-                body = resp.json()
+                body = orjson.loads(resp.content)
             except Exception:
                 body = resp.text
             raise DotClientError(resp.status_code, str(body), body)
 
         # Some endpoints return a plain list (e.g. /devices, /list)
-        return resp.json()
+        return resp.content
 
     # ── Device management ────────────────────────────────────────
 
+    async def list_devices_raw(self) -> bytes:
+        """GET /api/authV2/open/devices — raw JSON body."""
+        return await self._polled_get_raw(_DEVICES_PATH)
+
     async def list_devices(self) -> list[dict]:
         """GET /api/authV2/open/devices — list all devices."""
-        return await self._request("GET", f"{_BASE}/devices")
+        return orjson.loads(await self.list_devices_raw())
+
+    async def get_device_status_raw(self, device_id: str) -> bytes:
+        """GET /api/authV2/open/device/:id/status — raw JSON body."""
+        return await self._polled_get_raw(_device_path(device_id, "status"))
 
     async def get_device_status(self, device_id: str) -> dict:
         """GET /api/authV2/open/device/:id/status"""
-        return await self._request("GET", f"{_BASE}/device/{device_id}/status")
+        return orjson.loads(await self.get_device_status_raw(device_id))
 
     async def switch_next_content(self, device_id: str) -> dict:
         """POST /api/authV2/open/device/:id/next"""
-        return await self._request("POST", f"{_BASE}/device/{device_id}/next")
+        data = await self._post(_device_path(device_id, "next"))
+        self._invalidate_status(device_id)
+        return data
+
+    async def list_device_tasks_raw(
+        self, device_id: str, task_type: str = "loop"
+    ) -> bytes:
+        """GET /api/authV2/open/device/:deviceId/:taskType/list — raw JSON body."""
+        return await self._get_raw(_device_path(device_id, f"{task_type}/list"))
 
     async def list_device_tasks(
         self, device_id: str, task_type: str = "loop"
     ) -> list[dict]:
         """GET /api/authV2/open/device/:deviceId/:taskType/list"""
-        return await self._request(
-            "GET", f"{_BASE}/device/{device_id}/{task_type}/list"
-        )
+        return orjson.loads(await self.list_device_tasks_raw(device_id, task_type))
 
     # ── Text API ─────────────────────────────────────────────────
 
@@ -144,9 +207,9 @@ class DotClient:
         if task_key is not None:
             payload["taskKey"] = task_key
 
-        return await self._request(
-            "POST", f"{_BASE}/device/{device_id}/text", json=payload
-        )
+        data = await self._post(_device_path(device_id, "text"), json=payload)
+        self._invalidate_status(device_id)
+        return data
 
     # ── Image API ────────────────────────────────────────────────
 
@@ -175,6 +238,6 @@ class DotClient:
         if task_key is not None:
             payload["taskKey"] = task_key
 
-        return await self._request(
-            "POST", f"{_BASE}/device/{device_id}/image", json=payload
-        )
+        data = await self._post(_device_path(device_id, "image"), json=payload)
+        self._invalidate_status(device_id)
+        return data
@@ -3,13 +3,18 @@ Image processing utilities for the Dot Quote/0 e-ink display.
 Screen resolution: 296 x 152 pixels, black & white.
 """
 
-import base64
 import io
 import logging
-from typing import Optional
+from functools import lru_cache
+from typing import IO, Callable, Optional
 
 from PIL import Image, ImageDraw, ImageFont
 
+try:
+    import pybase64 as _b64
+except ImportError:  # fall back to the stdlib codec
+    import base64 as _b64
+
 from .config import get_settings
 
 logger = logging.getLogger(__name__)
@@ -26,20 +31,71 @@ def resize_image_to_screen(
     """
     Resize an image to fit the Quote/0 screen (296x152).
     Uses LANCZOS for high-quality downscaling.
+
+    Large inputs are first box-reduced by an integer factor to roughly
+    twice the target size, so LANCZOS only runs over a small image.
     """
+    if img.width > 4 * width or img.height > 4 * height:
+        k = min(img.width // (2 * width), img.height // (2 * height))
+        if k > 1:
+            # reduce() only handles continuous-tone modes; 16-bit images
+            # stay at full depth ("I") and are scaled in to_screen_mode
+            if img.mode in ("P", "PA"):
+                img = img.convert("RGBA")
+            elif img.mode == "1":
+                img = img.convert("L")
+            elif img.mode.startswith("I;16"):
+                img = img.convert("I")
+            img = img.reduce(k)
     return img.resize((width, height), Image.LANCZOS)
 
 
+def to_screen_mode(
+    img: Image.Image,
+    dither_type: str = "NONE",
+    dither_kernel: str = "FLOYD_STEINBERG",
+) -> Image.Image:
+    """
+    Reduce an image to what the 1-bpp screen can show before upload.
+
+    NONE is thresholded and DIFFUSION/FLOYD_STEINBERG is dithered locally
+    with Pillow's built-in Floyd-Steinberg; re-dithering a 1-bit image in
+    the cloud is a no-op, so the requested dither settings still apply.
+    Other dither modes keep grayscale so the cloud has detail to work on.
+    Transparent areas are flattened onto white first, and 16-bit
+    grayscale is scaled (not clipped) to 8 bits.
+    """
+    if img.mode == "I" or img.mode.startswith("I;16"):
+        img = img.convert("I").point(lambda v: v * (1 / 256)).convert("L")
+    if img.mode in ("RGBA", "LA", "PA") or (
+        img.mode == "P" and "transparency" in img.info
+    ):
+        img = img.convert("RGBA")
+        img = Image.alpha_composite(Image.new("RGBA", img.size, "white"), img)
+    if dither_type == "NONE":
+        return img.convert("1", dither=Image.NONE)
+    if dither_type == "DIFFUSION" and dither_kernel == "FLOYD_STEINBERG":
+        return img.convert("1", dither=Image.FLOYDSTEINBERG)
+    return img.convert("L")
+
+
 def image_to_base64(img: Image.Image, fmt: str = "PNG") -> str:
-    """Convert a PIL Image to a base64-encoded string."""
+    """
+    Convert a PIL Image to a base64-encoded string.
+
+    The payload is tiny (at most 296x152), so PNG uses the fastest
+    deflate level; pass a mode "1" / "L" image to shrink it further.
+    """
     buf = io.BytesIO()
-    img.save(buf, format=fmt)
-    return base64.b64encode(buf.getvalue()).decode("utf-8")
+    img.save(buf, format=fmt, compress_level=1)
+    # Encode straight from the buffer's memory instead of a getvalue() copy
+    with buf.getbuffer() as view:
+        return _b64.b64encode(view).decode("ascii")
 
 
 def base64_to_image(data: str) -> Image.Image:
     """Convert a base64 string to a PIL Image."""
-    raw = base64.b64decode(data)
+    raw = _b64.b64decode(data, validate=False)
     return Image.open(io.BytesIO(raw))
 
 
@@ -48,6 +104,37 @@ def bytes_to_image(data: bytes) -> Image.Image:
     return Image.open(io.BytesIO(data))
 
 
+def decode_and_fit(
+    fp: IO[bytes],
+    width: int = SCREEN_W,
+    height: int = SCREEN_H,
+) -> Image.Image:
+    """
+    Decode an image file and resize it to the screen in one pass.
+
+    For JPEGs, ``draft`` lets libjpeg downscale in the DCT domain (and
+    skip chroma) while decoding, so full-size photos are never
+    materialized; other formats ignore the draft request.
+    """
+    img = Image.open(fp)
+    img.draft("L", (width * 2, height * 2))
+    img.load()
+    return resize_image_to_screen(img, width, height)
+
+
+@lru_cache(maxsize=64)
+def _load_font(
+    path: Optional[str], size: int
+) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+    """Load (and cache) a TrueType font, falling back to Pillow's default."""
+    if path:
+        try:
+            return ImageFont.truetype(path, size)
+        except OSError:
+            logger.warning("Font %s not found, falling back to default", path)
+    return ImageFont.load_default(size=size)
+
+
 def render_text_to_image(
     title: Optional[str] = None,
     message: Optional[str] = None,
@@ -67,17 +154,14 @@ def render_text_to_image(
     Render text fields into a 296x152 black-and-white image suitable
     for the Quote/0 Image API.  This allows fully custom layouts that
     go beyond the built-in Text API formatting.
+
+    The image is drawn directly in 1-bit mode to match the screen.
     """
-    img = Image.new("RGB", (width, height), bg_color)
+    img = Image.new("1", (width, height), bg_color)
     draw = ImageDraw.Draw(img)
 
     def _font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
-        if font_path:
-            try:
-                return ImageFont.truetype(font_path, size)
-            except OSError:
-                logger.warning("Font %s not found, falling back to default", font_path)
-        return ImageFont.load_default(size=size)
+        return _load_font(font_path, size)
 
     y = padding
 
@@ -91,7 +175,7 @@ def render_text_to_image(
         fnt = _font(message_size)
         # Simple word-wrap within the screen width
         max_w = width - 2 * padding
-        lines = _wrap_text(draw, message, fnt, max_w)
+        lines = _wrap_text(message, fnt, max_w)
         for line in lines:
             if y > height - padding - message_size:
                 break
@@ -114,26 +198,81 @@ def render_text_to_image(
 
 
 def _wrap_text(
-    draw: ImageDraw.ImageDraw,
     text: str,
     font: ImageFont.FreeTypeFont | ImageFont.ImageFont,
     max_width: int,
 ) -> list[str]:
-    """Very simple line wrapper that respects \\n and pixel widths."""
+    """
+    Word-wrap text to a pixel width, respecting \\n.
+
+    Each word is measured once; words wider than a whole line (e.g. CJK
+    runs without spaces) are split by bisection.  ASCII-only text is
+    measured from a cached per-font glyph width table instead of FreeType.
+    """
+    if text.isascii():
+        widths = _ascii_widths(font)
+
+        def measure(s: str) -> float:
+            return sum(widths[ord(c)] for c in s)
+
+    else:
+        measure = font.getlength
+
     result: list[str] = []
+    space_w = measure(" ")
     for paragraph in text.split("\n"):
-        if not paragraph:
+        words = paragraph.split()
+        if not words:
             result.append("")
             continue
         current = ""
-        for ch in paragraph:
-            test = current + ch
-            bbox = draw.textbbox((0, 0), test, font=font)
-            if (bbox[2] - bbox[0]) > max_width and current:
+        cur_w = 0.0
+        for word in words:
+            w = measure(word)
+            if current and cur_w + space_w + w <= max_width:
+                current += " " + word
+                cur_w += space_w + w
+                continue
+            if current and w > max_width:
+                # Fill the rest of the current line before breaking the run
+                room = max_width - cur_w - space_w
+                if measure(word[:1]) <= room:
+                    n = _fit_prefix(word, measure, room)
+                    current += " " + word[:n]
+                    word = word[n:]
+                    w = measure(word)
+            if current:
                 result.append(current)
-                current = ch
-            else:
-                current = test
+            while w > max_width and len(word) > 1:
+                n = _fit_prefix(word, measure, max_width)
+                result.append(word[:n])
+                word = word[n:]
+                w = measure(word)
+            current, cur_w = word, w
         if current:
             result.append(current)
     return result
+
+
+@lru_cache(maxsize=32)
+def _ascii_widths(
+    font: ImageFont.FreeTypeFont | ImageFont.ImageFont,
+) -> tuple[float, ...]:
+    """Advance width of every ASCII character, indexed by code point."""
+    return tuple(font.getlength(chr(c)) for c in range(128))
+
+
+def _fit_prefix(
+    word: str,
+    measure: Callable[[str], float],
+    max_width: int,
+) -> int:
+    """Length of the longest prefix of word that fits (always at least 1)."""
+    lo, hi = 1, len(word)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if measure(word[:mid]) <= max_width:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
@@ -9,25 +9,27 @@ Also serves a visual web UI (Jinja2 templates) so non-technical users
 can manage the device from a browser.
 """
 
-import json
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
 
+import orjson
 from fastapi import FastAPI, File, Form, HTTPException, Query, Request, UploadFile
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
 from .config import get_settings
 from .dot_client import DotClient, DotClientError
 from .image_utils import (
-    bytes_to_image,
+    decode_and_fit,
     image_to_base64,
     render_text_to_image,
-    resize_image_to_screen,
+    to_screen_mode,
 )
+from .middleware import WildcardCORSMiddleware
 from .models import (
     DitherKernel,
     DitherType,
@@ -49,6 +51,9 @@ _SETTINGS_FILE = _APP_DIR.parent / "ui_settings.json"
 
 _dot_client: Optional[DotClient] = None
 
+# Default device id, resolved at startup and refreshed on settings save
+_DEFAULT_DEVICE_ID: str = ""
+
 
 def _get_client() -> DotClient:
     global _dot_client
@@ -57,18 +62,20 @@ def _get_client() -> DotClient:
     return _dot_client
 
 
+def _load_default_device() -> str:
+    """Default device: UI-saved settings (ui_settings.json) → .env → empty."""
+    return (
+        _load_ui_settings().get("device_id")
+        or get_settings().dot_default_device_id
+    )
+
+
 def _resolve_device(device_id: Optional[str]) -> str:
-    """Return the given device_id or fall back to ui_settings → .env → error."""
+    """Return the given device_id or fall back to the cached default → error."""
     if device_id:
         return device_id
-    # Fallback 1: UI-saved settings (ui_settings.json)
-    ui_device = _load_ui_settings().get("device_id")
-    if ui_device:
-        return ui_device
-    # Fallback 2: .env configuration
-    default = get_settings().dot_default_device_id
-    if default:
-        return default
+    if _DEFAULT_DEVICE_ID:
+        return _DEFAULT_DEVICE_ID
     raise HTTPException(
         status_code=400,
         detail="device_id is required (no default configured)",
@@ -77,7 +84,9 @@ def _resolve_device(device_id: Optional[str]) -> str:
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    global _DEFAULT_DEVICE_ID
     logger.info("Dot Service starting up ...")
+    _DEFAULT_DEVICE_ID = _load_default_device()
     yield
     if _dot_client:
         await _dot_client.close()
@@ -96,25 +105,28 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+app.add_middleware(WildcardCORSMiddleware)
 
 # Mount static files and templates
 app.mount("/static", StaticFiles(directory=str(_STATIC_DIR)), name="static")
 templates = Jinja2Templates(directory=str(_TEMPLATES_DIR))
 
 
-# ── Error handler ───────────────────────────────────────────────────
+# ── Response helpers ────────────────────────────────────────────────
 
 
 def _handle_dot_error(e: DotClientError) -> HTTPException:
     return HTTPException(status_code=e.status_code, detail=e.message)
 
 
+def _ok_raw(raw: bytes) -> Response:
+    """Wrap a raw upstream JSON body in the ServiceResponse envelope as-is."""
+    return Response(
+        content=b'{"success":true,"message":"ok","data":' + raw + b"}",
+        media_type="application/json",
+    )
+
+
 # ── UI settings persistence ─────────────────────────────────────────
 
 
@@ -122,14 +134,16 @@ def _load_ui_settings() -> dict:
     """Load UI-saved settings from ui_settings.json (if exists)."""
     if _SETTINGS_FILE.exists():
         try:
-            return json.loads(_SETTINGS_FILE.read_text("utf-8"))
+            return orjson.loads(_SETTINGS_FILE.read_bytes())
         except Exception:
             pass
     return {}
 
 
 def _save_ui_settings(data: dict) -> None:
-    _SETTINGS_FILE.write_text(json.dumps(data, ensure_ascii=False, indent=2), "utf-8")
+    _SETTINGS_FILE.write_bytes(
+        orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    )
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -185,8 +199,9 @@ async def save_settings(request: Request):
     }
     _save_ui_settings(data)
 
-    # Hot-reload the DotClient with new credentials
-    global _dot_client
+    # Hot-reload the default device and the DotClient with new credentials
+    global _dot_client, _DEFAULT_DEVICE_ID
+    _DEFAULT_DEVICE_ID = _load_default_device()
     if _dot_client:
         await _dot_client.close()
     _dot_client = DotClient(
@@ -216,8 +231,8 @@ async def health():
 async def list_devices():
     """List all devices bound to this API key."""
     try:
-        data = await _get_client().list_devices()
-        return ServiceResponse(success=True, message="ok", data=data)
+        raw = await _get_client().list_devices_raw()
+        return _ok_raw(raw)
     except DotClientError as e:
         raise _handle_dot_error(e)
 
@@ -228,8 +243,8 @@ async def list_devices():
 async def get_device_status(device_id: str):
     """Get the status of a specific device (battery, wifi, firmware, render info)."""
     try:
-        data = await _get_client().get_device_status(device_id)
-        return ServiceResponse(success=True, message="ok", data=data)
+        raw = await _get_client().get_device_status_raw(device_id)
+        return _ok_raw(raw)
     except DotClientError as e:
         raise _handle_dot_error(e)
 
@@ -251,8 +266,8 @@ async def list_device_tasks(
 ):
     """List all tasks on the device."""
     try:
-        data = await _get_client().list_device_tasks(device_id, task_type)
-        return ServiceResponse(success=True, message="ok", data=data)
+        raw = await _get_client().list_device_tasks_raw(device_id, task_type)
+        return _ok_raw(raw)
     except DotClientError as e:
         raise _handle_dot_error(e)
 
@@ -316,6 +331,19 @@ async def send_image(req: SendImageRequest):
         raise _handle_dot_error(e)
 
 
+def _prepare_upload_sync(
+    fp: BinaryIO, dither_type: DitherType, dither_kernel: DitherKernel
+) -> str:
+    """Decode, resize and base64-encode an uploaded image (blocking)."""
+    try:
+        img = decode_and_fit(fp)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid image file")
+
+    img = to_screen_mode(img, dither_type.value, dither_kernel.value)
+    return image_to_base64(img)
+
+
 @app.post("/image/upload", tags=["content"], response_model=ServiceResponse)
 async def send_image_upload(
     file: UploadFile = File(..., description="Image file (PNG/JPG/BMP/GIF)"),
@@ -332,14 +360,11 @@ async def send_image_upload(
     and send it to the Quote e-ink screen.
     """
     device_id = _resolve_device(device_id)
-    raw = await file.read()
-    try:
-        img = bytes_to_image(raw)
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid image file")
-
-    img = resize_image_to_screen(img)
-    b64 = image_to_base64(img)
+    # Decode from the spooled upload file in a worker thread, without
+    # reading it into memory first or blocking the event loop.
+    b64 = await asyncio.to_thread(
+        _prepare_upload_sync, file.file, dither_type, dither_kernel
+    )
 
     try:
         data = await _get_client().send_image(
@@ -364,6 +389,11 @@ async def send_image_upload(
 # ═══════════════════════════════════════════════════════════════════
 
 
+def _render_text_sync(**kwargs) -> str:
+    """Render text fields to an image and base64-encode it (blocking)."""
+    return image_to_base64(render_text_to_image(**kwargs))
+
+
 @app.post("/text-to-image", tags=["content"], response_model=ServiceResponse)
 async def send_text_as_image(
     device_id: Optional[str] = Query(None),
@@ -389,7 +419,8 @@ async def send_text_as_image(
     """
     device_id = _resolve_device(device_id)
 
-    img = render_text_to_image(
+    b64 = await asyncio.to_thread(
+        _render_text_sync,
         title=title,
         message=message,
         signature=signature,
@@ -398,7 +429,6 @@ async def send_text_as_image(
         message_size=message_size,
         signature_size=signature_size,
     )
-    b64 = image_to_base64(img)
 
     try:
         data = await _get_client().send_image(
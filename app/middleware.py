@@ -0,0 +1,60 @@
+"""
+Lightweight ASGI middleware for Dot Service.
+"""
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+_ALLOW_ORIGIN = (b"access-control-allow-origin", b"*")
+
+_PREFLIGHT_HEADERS = [
+    _ALLOW_ORIGIN,
+    (b"access-control-allow-methods", b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"),
+    (b"access-control-max-age", b"600"),
+]
+
+
+class WildcardCORSMiddleware:
+    """
+    CORS for a service open to any origin (no credentials).
+
+    Preflight requests are answered directly with pre-built headers and
+    every other response just gets ``Access-Control-Allow-Origin: *``,
+    skipping the per-request origin matching of Starlette's CORSMiddleware.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS":
+            is_preflight = False
+            requested_headers = None
+            for key, value in scope["headers"]:
+                if key == b"access-control-request-method":
+                    is_preflight = True
+                elif key == b"access-control-request-headers":
+                    requested_headers = value
+            if is_preflight:
+                headers = _PREFLIGHT_HEADERS
+                if requested_headers is not None:
+                    # "*" does not cover Authorization, so echo the request
+                    headers = [
+                        *headers,
+                        (b"access-control-allow-headers", requested_headers),
+                    ]
+                await send(
+                    {"type": "http.response.start", "status": 204, "headers": headers}
+                )
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), _ALLOW_ORIGIN]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
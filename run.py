@@ -1,9 +1,12 @@
 #!/usr/bin/env python3
 """
 Entry point for running the Dot Service directly:
-    python run.py
+    python run.py          # production
+    DEV=1 python run.py    # auto-reload on code changes
 """
 
+import os
+
 import uvicorn
 
 from app.config import get_settings
@@ -11,11 +14,15 @@ from app.config import get_settings
 
 def main():
     s = get_settings()
+    reload = os.environ.get("DEV", "") == "1"
     uvicorn.run(
         "app.main:app",
         host=s.service_host,
         port=s.service_port,
-        reload=True,
+        reload=reload,
+        # "auto" picks uvloop / httptools from uvicorn[standard] when available
+        loop="auto",
+        http="auto",
     )
 
 
@@ -0,0 +1,34 @@
+import io
+import struct
+
+from PIL import Image, ImageStat
+
+from app.image_utils import decode_and_fit, to_screen_mode
+
+
+def _gradient_16bit_png(width: int, height: int) -> io.BytesIO:
+    """Horizontal 0-65535 gradient saved as a 16-bit grayscale PNG."""
+    row = [x * 65535 // (width - 1) for x in range(width)]
+    data = struct.pack(f"<{width * height}H", *(row * height))
+    buf = io.BytesIO()
+    Image.frombytes("I;16", (width, height), data).save(buf, format="PNG")
+    buf.seek(0)
+    return buf
+
+
+def _assert_tone_range(img: Image.Image) -> None:
+    gray = img.convert("L")
+    assert gray.getextrema() == (0, 255)
+    assert 100 < ImageStat.Stat(gray).mean[0] < 155
+
+
+def test_16bit_upload_keeps_tone_range():
+    img = decode_and_fit(_gradient_16bit_png(400, 200))
+    for dither_type in ("NONE", "DIFFUSION", "ORDERED"):
+        _assert_tone_range(to_screen_mode(img, dither_type))
+
+
+def test_large_16bit_upload_keeps_tone_range_through_box_reduce():
+    img = decode_and_fit(_gradient_16bit_png(2000, 1000))
+    for dither_type in ("NONE", "DIFFUSION", "ORDERED"):
+        _assert_tone_range(to_screen_mode(img, dither_type))